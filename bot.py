@@ -1,39 +1,223 @@
 import os
+import asyncio
+import atexit
+import dataclasses
 import json
 import datetime
+import functools
 import logging
+import logging.handlers
+import queue
 import random
+import re
+import threading
+import time
 import gspread
+from gspread.utils import a1_range_to_grid_range, absolute_range_name, rowcol_to_a1
+from google.auth.transport.requests import AuthorizedSession
 from google.oauth2.service_account import Credentials
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from telegram import Update
 from telegram.ext import Application, CommandHandler, MessageHandler, filters, ContextTypes
 from dotenv import load_dotenv
 
 load_dotenv()
 
-# Configure logging
-logging.basicConfig(
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    level=logging.INFO
-)
+# Configure logging: handlers only enqueue records, a listener thread does the writes
+log_queue = queue.SimpleQueue()
+log_stream = logging.StreamHandler()
+log_stream.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+log_listener = logging.handlers.QueueListener(log_queue, log_stream, respect_handler_level=True)
+logging.getLogger().addHandler(logging.handlers.QueueHandler(log_queue))
+logging.getLogger().setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+log_listener.start()
+atexit.register(log_listener.stop)
 logger = logging.getLogger(__name__)
 
 # Moscow timezone
 MOSCOW_TZ = datetime.timezone(datetime.timedelta(hours=3))
 
+# /1-/5 commands: habit id -> (Activity column, display name)
+HABIT_MAP = {
+    1: ("Prayer", "Prayer with first water"),
+    2: ("Qi Gong", "Qi Gong routine"),
+    3: ("Ball", "Ball freestyling"),
+    4: ("Run/Stretch", "20 minute run and stretch"),
+    5: ("Strength/Stretch", "Strengthening and stretching")
+}
+
+# x/y/z messages: habit letter -> Consumption columns and message category
+CONSUMPTION_MAP = {
+    'x': {'count_col': 'Coffee (x)', 'cost_col': 'Coffee Cost', 'name': 'Coffee', 'category': 'coffee'},
+    'y': {'count_col': 'Sugary (y)', 'cost_col': 'Sugary Cost', 'name': 'Sugary drinks', 'category': 'sugar_flour'},
+    'z': {'count_col': 'Flour (z)', 'cost_col': 'Flour Cost', 'name': 'Flour products', 'category': 'sugar_flour'}
+}
+
+# Language codes -> (Language column, display name)
+LANG_MAP = {
+    'ch': ('Chinese (ch)', 'Chinese'),
+    'he': ('Hebrew (he)', 'Hebrew'),
+    'ta': ('Tatar (ta)', 'Tatar')
+}
+
+# Reply to /start and /help
+HELP_TEXT = """
+🥋 Sambo Habit Tracker Bot
 
-class SamboBot:
-    def __init__(self):
-        self.bot_token = os.getenv("TELEGRAM_BOT_TOKEN")
-        self.sheet_id = os.getenv("GOOGLE_SHEET_ID")
-        self.user_id = os.getenv("TELEGRAM_USER_ID")
+📊 ACTIVITY:
+/1 Prayer
+/2 Qi Gong
+/3 Ball
+/4 Run/Stretch
+/5 Strength/Stretch
+
+🍽 CONSUMPTION:
+x, xx, xxx (+ cost)
+y, yy, yyy
+z, zz, zzz
+
+🌍 LANGUAGES:
+ch, he, ta
+"""
+
+# Worksheet tabs the bot reads and writes
+SHEET_TITLES = ("Activity", "Consumption", "Language")
+
+# Routing and row-initialisation lookups derived from the maps above
+HABIT_COLUMNS = tuple(column_name for column_name, _ in HABIT_MAP.values())
+CONSUMPTION_PREFIXES = frozenset(CONSUMPTION_MAP)
+CONSUMPTION_COUNT_COLUMNS = frozenset(config['count_col'] for config in CONSUMPTION_MAP.values())
+LANG_CODES = frozenset(LANG_MAP)
+LANG_COLUMNS = frozenset(column_name for column_name, _ in LANG_MAP.values())
+
+# Data columns added once at startup if missing. Activity columns are left to
+# the user: record_activity refuses a habit whose column isn't there.
+SHEET_COLUMNS = {
+    "Consumption": tuple(
+        column_name for config in CONSUMPTION_MAP.values() for column_name in (config['count_col'], config['cost_col'])
+    ),
+    "Language": tuple(column_name for column_name, _ in LANG_MAP.values()),
+}
+
+# A run of one consumption letter, optionally followed by a cost and a free-form
+# note: "xx", "y 150", "z 10.5", "x 150 latte"
+CONSUMPTION_RE = re.compile(
+    rf"(?P<letters>(?P<habit>[{''.join(CONSUMPTION_MAP)}])(?P=habit)*)(?:\s+(?P<cost>\d+(?:\.\d+)?)(?:\s+.*)?)?"
+)
+
+# How long cached header rows and row numbers are trusted before re-reading
+CACHE_TTL = 300  # seconds
+
+# Retries for Sheets quota (429) and transient server errors, and the cap on a single backoff wait
+SHEETS_MAX_ATTEMPTS = 5
+SHEETS_MAX_BACKOFF = 30  # seconds
+SHEETS_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# How often buffered cell writes are pushed to Sheets
+FLUSH_INTERVAL = 3  # seconds
+
+# Telegram updates handled at once; record_* still serialise per sheet
+MAX_CONCURRENT_UPDATES = 8
 
-        if not self.bot_token:
+
+@functools.lru_cache(maxsize=2)
+def get_date_strings(day):
+    """Return (YYYY-MM-DD, week-start YYYY-MM-DD) for a date, formatted once per day"""
+    week_start = datetime.date.fromordinal(day.toordinal() - day.weekday())
+    return day.isoformat(), week_start.isoformat()
+
+
+def is_counter_column(header_name):
+    """Whether a new day row starts this column at 0 rather than blank"""
+    return "Cost" in header_name or header_name in CONSUMPTION_COUNT_COLUMNS or header_name in LANG_COLUMNS
+
+
+def cell_int(value):
+    """Return an unformatted cell value as an int, 0 for blank or non-numeric cells"""
+    if isinstance(value, int):
+        return value
+    try:
+        return int(value) if str(value).strip() else 0
+    except (ValueError, TypeError):
+        return 0
+
+
+@functools.lru_cache(maxsize=1)
+def get_gs_client(creds_path):
+    """Build the gspread client once per credentials file and reuse it across SamboBot instances"""
+    with open(creds_path, "r") as f:
+        creds_dict = json.load(f)
+
+    credentials = Credentials.from_service_account_info(
+        creds_dict,
+        scopes=['https://www.googleapis.com/auth/spreadsheets']
+    )
+
+    # One pooled keep-alive session for every Sheets request, so the
+    # TLS handshake is paid once instead of per call. Only dropped
+    # connections are retried here; 429/5xx are left to call_sheets().
+    session = AuthorizedSession(credentials)
+    session.mount("https://", HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.3)
+    ))
+
+    return gspread.Client(auth=credentials, session=session)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Config:
+    """Settings read from the environment once at startup"""
+    bot_token: str
+    sheet_id: str
+    # Parsed once here so handlers compare plain ints on every update
+    user_id: int
+    creds_path: str
+
+    @classmethod
+    def from_env(cls):
+        bot_token = os.getenv("TELEGRAM_BOT_TOKEN")
+        sheet_id = os.getenv("GOOGLE_SHEET_ID")
+        user_id = os.getenv("TELEGRAM_USER_ID")
+        creds_path = os.getenv("GOOGLE_CREDENTIALS_PATH")
+
+        if not bot_token:
             raise ValueError("TELEGRAM_BOT_TOKEN not set")
-        if not self.sheet_id:
+        if not sheet_id:
             raise ValueError("GOOGLE_SHEET_ID not set")
-        if not self.user_id:
+        if not user_id:
             raise ValueError("TELEGRAM_USER_ID not set")
+        if not user_id.strip().isdigit():
+            raise ValueError("TELEGRAM_USER_ID must be a numeric Telegram user id")
+        if not creds_path:
+            raise ValueError("GOOGLE_CREDENTIALS_PATH not set")
+
+        return cls(
+            bot_token=bot_token,
+            sheet_id=sheet_id,
+            user_id=int(user_id),
+            creds_path=creds_path
+        )
+
+
+class SamboBot:
+    def __init__(self, config=None):
+        self.config = config or Config.from_env()
+        self.bot_token = self.config.bot_token
+        self.sheet_id = self.config.sheet_id
+        self.user_id = self.config.user_id
+
+        # sheet title -> (loaded_at, header list, {header: 1-based column})
+        self.headers_cache = {}
+        # sheet title -> (loaded_at, {(user_id, date): row number})
+        self.row_index = {}
+        # A1 range -> (loaded_at, value) for cells read or written recently
+        self.cell_cache = {}
+        # A1 range -> value waiting for the next flush_writes()
+        self.pending_writes = {}
+        self.write_lock = threading.Lock()
 
         self.load_messages()
         self.init_sheets()
@@ -54,7 +238,7 @@ class SamboBot:
             
             logger.info("✅ Motivational messages loaded successfully")
         except Exception as e:
-            logger.error(f"❌ Failed to load messages.json: {e}")
+            logger.error("❌ Failed to load messages.json: %s", e)
             # Fallback to empty messages
             self.messages = {"coffee": [], "sugar_flour": []}
 
@@ -96,406 +280,608 @@ class SamboBot:
     def init_sheets(self):
         """Initialize Google Sheets connection"""
         try:
-            creds_path = os.getenv("GOOGLE_CREDENTIALS_PATH")
-            if not creds_path:
-                raise ValueError("GOOGLE_CREDENTIALS_PATH not set")
-
-            with open(creds_path, "r") as f:
-                creds_dict = json.load(f)
+            self.gs_client = get_gs_client(self.config.creds_path)
+            self.spreadsheet = self.call_sheets(self.gs_client.open_by_key, self.sheet_id)
 
-            credentials = Credentials.from_service_account_info(
-                creds_dict,
-                scopes=['https://www.googleapis.com/auth/spreadsheets']
-            )
+            self.sheet_locks = {title: threading.Lock() for title in SHEET_TITLES}
 
-            self.gs_client = gspread.authorize(credentials)
-            self.spreadsheet = self.gs_client.open_by_key(self.sheet_id)
-
-            self.activity_sheet = self.spreadsheet.worksheet("Activity")
-            self.consumption_sheet = self.spreadsheet.worksheet("Consumption")
-            self.language_sheet = self.spreadsheet.worksheet("Language")
+            # Header rows and row indexes are loaded once here; record_* methods
+            # work off these caches and extend them locally when they append a
+            # row or queue a new header cell.
+            self.prime_caches()
+            self.ensure_headers()
 
             logger.info("✅ Google Sheets initialized successfully")
         except Exception as e:
-            logger.error(f"❌ Failed to initialize Google Sheets: {e}")
+            logger.error("❌ Failed to initialize Google Sheets: %s", e)
             raise
 
-    def get_moscow_now(self):
-        return datetime.datetime.now(MOSCOW_TZ)
-
-    def get_week_number(self, date=None):
-        if date is None:
-            date = self.get_moscow_now()
-        days_since_monday = date.weekday()
-        week_start = date - datetime.timedelta(days=days_since_monday)
-        return week_start.strftime("%Y-%m-%d")
-
-    # ===================== ACTIVITY (FIXED) =====================
+    @functools.cached_property
+    def worksheets(self):
+        """{title: worksheet}, fetched with a single metadata call on first use"""
+        return {sheet.title: sheet for sheet in self.call_sheets(self.spreadsheet.worksheets)}
 
-    def record_activity(self, user_id, habit_id):
-        """Record activity habit safely into a single daily row"""
+    def get_worksheet(self, title):
         try:
-            now = self.get_moscow_now()
-            today_str = now.strftime("%Y-%m-%d")
-            week_number = self.get_week_number(now)
-
-            habit_map = {
-                1: ("Prayer", "Prayer with first water"),
-                2: ("Qi Gong", "Qi Gong routine"),
-                3: ("Ball", "Ball freestyling"),
-                4: ("Run/Stretch", "20 minute run and stretch"),
-                5: ("Strength/Stretch", "Strengthening and stretching")
-            }
-
-            if habit_id not in habit_map:
-                return False, "Invalid habit number. Use 1-5."
+            return self.worksheets[title]
+        except KeyError:
+            raise gspread.exceptions.WorksheetNotFound(title) from None
 
-            column_name, habit_name = habit_map[habit_id]
+    @property
+    def activity_sheet(self):
+        return self.get_worksheet("Activity")
 
-            logger.info(f"📝 Recording {habit_name} for {user_id} on {today_str}")
+    @property
+    def consumption_sheet(self):
+        return self.get_worksheet("Consumption")
 
-            row_num = self.find_or_create_activity_row(user_id, today_str, week_number)
-            if not row_num:
-                return False, "Failed to create activity row"
+    @property
+    def language_sheet(self):
+        return self.get_worksheet("Language")
 
-            headers = [h.strip() for h in self.activity_sheet.row_values(1)]
+    def call_sheets(self, func, *args, retry_statuses=SHEETS_RETRY_STATUSES, **kwargs):
+        """Call a gspread method, retrying quota and server errors with jittered exponential backoff
 
-            if column_name not in headers:
-                return False, f"Column '{column_name}' not found in Activity sheet"
-
-            col_index = headers.index(column_name) + 1
+        Args:
+            retry_statuses: HTTP statuses worth retrying; non-idempotent calls
+                should pass only 429, which guarantees nothing was applied
+        """
+        for attempt in range(SHEETS_MAX_ATTEMPTS):
+            try:
+                return func(*args, **kwargs)
+            except gspread.exceptions.APIError as e:
+                status = e.response.status_code
+                if status not in retry_statuses or attempt == SHEETS_MAX_ATTEMPTS - 1:
+                    raise
+                delay = min(SHEETS_MAX_BACKOFF, 2 ** attempt + random.random())
+                logger.warning("⚠️ Sheets returned %s, retrying in %.1fs", status, delay)
+                time.sleep(delay)
+
+    def cache_headers(self, title, headers):
+        """Store a header row and its {header: 1-based column} map in headers_cache"""
+        headers = [h.strip() for h in headers]
+        column_index = {}
+        for i, name in enumerate(headers):
+            column_index.setdefault(name, i + 1)
+        self.headers_cache[title] = (time.monotonic(), headers, column_index)
+        return headers, column_index
+
+    def load_headers(self, sheet):
+        """Return (header list, {header: 1-based column}) for a worksheet, re-read after CACHE_TTL"""
+        cached = self.headers_cache.get(sheet.title)
+        if cached is None or time.monotonic() - cached[0] > CACHE_TTL:
+            return self.cache_headers(sheet.title, self.call_sheets(sheet.row_values, 1))
+        return cached[1], cached[2]
+
+    def get_headers(self, sheet):
+        """Return the cached header row of a worksheet"""
+        return self.load_headers(sheet)[0]
+
+    def get_header_index(self, sheet):
+        """Return the cached {header: 1-based column} map of a worksheet"""
+        return self.load_headers(sheet)[1]
+
+    def invalidate_caches(self):
+        """Drop cached headers and row indexes so the next call re-reads Sheets"""
+        self.headers_cache.clear()
+        self.row_index.clear()
+        self.cell_cache.clear()
+
+    def get_row(self, sheet, user_id, date_str, week_number, initial_values=None):
+        """Return today's row for a user, appending a full-width row if needed
 
-            current_value = self.activity_sheet.cell(row_num, col_index).value
-            if current_value and str(current_value).strip():
-                return False, f"{habit_name} already recorded today"
+        Args:
+            initial_values: {column name: value} to write into the row if it
+                has to be created, saving a separate update afterwards
 
-            self.activity_sheet.update_cell(row_num, col_index, "✓")
+        Returns:
+            tuple: (row number or None, True if the row was just created)
+        """
+        try:
+            row_num = self.find_row(sheet, user_id, date_str)
+            if row_num:
+                logger.debug("🎯 Found %s row at %s", sheet.title, row_num)
+                return row_num, False
+
+            logger.info("📝 Creating new %s row", sheet.title)
+
+            user_col, date_col = self.key_columns[sheet.title]
+            new_row = []
+            for col, header_name in enumerate(self.get_headers(sheet), start=1):
+                if col == user_col:
+                    new_row.append(str(user_id))
+                elif col == date_col:
+                    new_row.append(date_str)
+                elif initial_values and header_name in initial_values:
+                    new_row.append(initial_values[header_name])
+                elif header_name == "Week Number":
+                    new_row.append(week_number)
+                elif is_counter_column(header_name):
+                    new_row.append(0)
+                else:
+                    new_row.append("")
 
-            timestamp = now.strftime("%H:%M")
-            return True, f"✓ {habit_name} recorded at {timestamp}!"
+            return self.append_row(sheet, user_id, date_str, new_row), True
 
         except Exception as e:
-            logger.error(f"❌ Error recording activity: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
-            return False, "Error recording habit"
-
-    def find_or_create_activity_row(self, user_id, date_str, week_number):
-        """Find or create a full-width row mapped by headers"""
-        try:
-            all_data = self.activity_sheet.get_all_values()
-            headers = [h.strip() for h in self.activity_sheet.row_values(1)]
-            col_map = {h: i for i, h in enumerate(headers)}
-
-            for i, row in enumerate(all_data[1:], start=2):
-                if len(row) < len(headers):
-                    row += [""] * (len(headers) - len(row))
+            logger.exception("❌ Error finding %s row: %s", sheet.title, e)
+            # The append may have gone through before the error, and a header
+            # queued for it may not have; re-read both rather than append twice
+            self.row_index.pop(sheet.title, None)
+            self.headers_cache.pop(sheet.title, None)
+            return None, False
 
-                row_user = str(row[col_map["User ID"]]).strip()
-                row_date = str(row[col_map["Date"]]).strip()
+    def get_row_index(self, sheet):
+        """Return the {(user_id, date): row} index of a sheet, rebuilding it after CACHE_TTL
 
-                if row_user == str(user_id) and row_date == date_str:
-                    logger.info(f"🎯 Found activity row at {i}")
-                    return i
+        Only the two key columns are downloaded, in a single values_batch_get.
+        """
+        cached = self.row_index.get(sheet.title)
+        if cached is not None and time.monotonic() - cached[0] <= CACHE_TTL:
+            return cached[1]
+
+        ranges = []
+        for col in self.key_columns[sheet.title]:
+            letter = rowcol_to_a1(1, col)[:-1]
+            ranges.append(absolute_range_name(sheet.title, f"{letter}:{letter}"))
+
+        response = self.call_sheets(
+            self.spreadsheet.values_batch_get, ranges, params={"majorDimension": "COLUMNS"}
+        )
+        users, dates = [
+            value_range.get("values", [[]])[0] for value_range in response["valueRanges"]
+        ]
+        return self.cache_row_index(sheet.title, users, dates)
+
+    def cache_row_index(self, title, users, dates):
+        """Build and store a sheet's row index from its User ID and Date columns, header included"""
+        index = {}
+        for i in range(1, min(len(users), len(dates))):
+            # Keep the first match, as the old top-down scan did
+            index.setdefault((users[i].strip(), dates[i].strip()), i + 1)
+
+        self.row_index[title] = (time.monotonic(), index)
+        return index
+
+    def prime_caches(self):
+        """Load every sheet's header row and first two columns in one values_batch_get
+
+        Sheets keyed by other columns than A/B get their row index from a
+        follow-up get_row_index() instead.
+        """
+        ranges = []
+        for title in SHEET_TITLES:
+            ranges += [absolute_range_name(title, "1:1"), absolute_range_name(title, "A:B")]
+
+        response = self.call_sheets(
+            self.spreadsheet.values_batch_get, ranges, params={"majorDimension": "COLUMNS"}
+        )
+        value_ranges = response["valueRanges"]
+
+        for i, title in enumerate(SHEET_TITLES):
+            header_columns = value_ranges[2 * i].get("values", [])
+            self.cache_headers(title, [column[0] if column else "" for column in header_columns])
+
+        self.key_columns = self.find_key_columns()
+
+        for i, title in enumerate(SHEET_TITLES):
+            if self.key_columns[title] != (1, 2):
+                self.get_row_index(self.get_worksheet(title))
+                continue
+            key_columns = value_ranges[2 * i + 1].get("values", [])
+            users, dates = (key_columns + [[], []])[:2]
+            self.cache_row_index(title, users, dates)
+
+    def find_key_columns(self):
+        """Return {sheet title: 1-based (User ID, Date) columns} from the cached headers"""
+        activity_columns = self.headers_cache["Activity"][2]
+        return {
+            "Activity": (activity_columns["User ID"], activity_columns["Date"]),
+            "Consumption": (1, 2),
+            "Language": (1, 2)
+        }
+
+    def find_row(self, sheet, user_id, date_str):
+        """Look up a (user, date) row in the cached row index, None if it doesn't exist yet"""
+        return self.get_row_index(sheet).get((str(user_id), date_str))
+
+    def remember_row(self, sheet, user_id, date_str, row_num):
+        """Record a freshly appended row in the row index without re-reading the sheet"""
+        self.get_row_index(sheet)[(str(user_id), date_str)] = row_num
+
+    def append_row(self, sheet, user_id, date_str, new_row):
+        """Append a (user, date) row and return the row number Sheets actually wrote it to"""
+        # A 5xx may hide an append that went through, so only quota errors are retried.
+        # RAW keeps the User ID/Date keys as plain text, matching older rows and
+        # the formatted values the row index is built from.
+        response = self.call_sheets(
+            sheet.append_row, new_row, value_input_option="RAW",
+            insert_data_option="INSERT_ROWS", table_range="A1", retry_statuses={429}
+        )
+        updated_range = response["updates"]["updatedRange"].rsplit("!", 1)[-1]
+        row_num = a1_range_to_grid_range(updated_range)["startRowIndex"] + 1
+        self.remember_row(sheet, user_id, date_str, row_num)
+        return row_num
+
+    def ensure_headers(self):
+        """Add any SHEET_COLUMNS missing from the header rows in one batched write"""
+        updates = []
+        for title, column_names in SHEET_COLUMNS.items():
+            sheet = self.get_worksheet(title)
+            for column_name in column_names:
+                self.get_column_index(sheet, column_name, updates)
+
+        if updates:
+            logger.info("Adding %d missing header(s)", len(updates))
+            self.write_cells(updates)
+            try:
+                self.flush_writes()
+            except Exception as e:
+                # Still buffered; the periodic flush retries them
+                logger.warning("⚠️ Failed to add missing headers, will retry: %s", e)
 
-            logger.info("📝 Creating new activity row")
+    def get_column_index(self, sheet, column_name, updates):
+        """Return the 1-based column index of a header, queueing it if missing"""
+        headers, column_index = self.load_headers(sheet)
+        try:
+            return column_index[column_name]
+        except KeyError:
+            headers.append(column_name)
+            column_index[column_name] = len(headers)
+            updates.append(self.cell_update(sheet, 1, len(headers), column_name))
+            return column_index[column_name]
 
-            new_row = [""] * len(headers)
-            new_row[col_map["User ID"]] = str(user_id)
-            new_row[col_map["Date"]] = date_str
-            new_row[col_map["Week Number"]] = week_number
-            new_row[col_map["Goals"]] = ""
+    def read_cells(self, sheet, cells):
+        """Read several single cells of a worksheet, fetching only uncached ones
 
-            self.activity_sheet.append_row(new_row)
-            return len(all_data) + 1
+        Pending writes and cached values are served locally; anything else is
+        read in one values_batch_get.
 
-        except Exception as e:
-            logger.error(f"❌ Error finding activity row: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
-            return None
+        Args:
+            sheet: worksheet to read from
+            cells: list of (row, col) tuples, 1-based
 
-    # ===================== CONSUMPTION =====================
+        Returns:
+            list: cell values in the same order ('' for empty cells)
+        """
+        ranges = [absolute_range_name(sheet.title, rowcol_to_a1(row, col)) for row, col in cells]
+        values = {}
+        now = time.monotonic()
+        with self.write_lock:
+            for cell_range in ranges:
+                cached = self.cell_cache.get(cell_range)
+                if cell_range in self.pending_writes:
+                    values[cell_range] = self.pending_writes[cell_range]
+                elif cached and now - cached[0] <= CACHE_TTL:
+                    values[cell_range] = cached[1]
+
+        missing = [cell_range for cell_range in ranges if cell_range not in values]
+        if missing:
+            # Numbers come back as JSON numbers rather than formatted strings
+            response = self.call_sheets(
+                self.spreadsheet.values_batch_get, missing, params={"valueRenderOption": "UNFORMATTED_VALUE"}
+            )
+            for cell_range, value_range in zip(missing, response["valueRanges"]):
+                values[cell_range] = value_range.get("values", [[""]])[0][0]
+                self.cell_cache[cell_range] = (now, values[cell_range])
+
+        return [values[cell_range] for cell_range in ranges]
+
+    def remember_cells(self, sheet, row, values):
+        """Cache {col: value} of a row that was just written, e.g. by append_row"""
+        now = time.monotonic()
+        for col, value in values.items():
+            self.cell_cache[absolute_range_name(sheet.title, rowcol_to_a1(row, col))] = (now, value)
+
+    def cell_update(self, sheet, row, col, value):
+        """Build a single-cell entry for a values.batchUpdate payload"""
+        return {
+            "range": absolute_range_name(sheet.title, rowcol_to_a1(row, col)),
+            "values": [[value]]
+        }
+
+    def write_cells(self, updates):
+        """Buffer cell updates until the next flush_writes()
+
+        Later writes to the same cell replace earlier ones, so a burst of
+        commands touching today's rows goes out as a single batch.
+        """
+        now = time.monotonic()
+        with self.write_lock:
+            for update in updates:
+                value = update["values"][0][0]
+                self.pending_writes[update["range"]] = value
+                self.cell_cache[update["range"]] = (now, value)
+
+    def flush_writes(self):
+        """Send all buffered cell updates to Sheets in one values_batch_update
+
+        A batch that fails with a retryable status or a network error goes
+        back into the buffer for the next flush. One that Sheets rejects
+        outright is dropped, so it can't block every later write.
+        """
+        with self.write_lock:
+            batch, self.pending_writes = self.pending_writes, {}
+        if not batch:
+            return
 
-    def record_consumption(self, user_id, text):
         try:
-            now = self.get_moscow_now()
-            today_str = now.strftime("%Y-%m-%d")
-            week_number = self.get_week_number(now)
-
-            text = text.strip().lower()
-            parts = text.split()
+            self.call_sheets(
+                self.spreadsheet.values_batch_update,
+                body={
+                    "valueInputOption": "USER_ENTERED",
+                    "data": [{"range": cell_range, "values": [[value]]} for cell_range, value in batch.items()]
+                }
+            )
+        except gspread.exceptions.APIError as e:
+            if e.response.status_code in SHEETS_RETRY_STATUSES:
+                self.requeue_writes(batch)
+                raise
+            # Cached copies of the dropped values would keep reporting them as
+            # recorded, so re-read everything from Sheets instead
+            logger.error("❌ Sheets rejected %d buffered write(s), dropping them: %s", len(batch), e)
+            self.invalidate_caches()
+        except Exception:
+            self.requeue_writes(batch)
+            raise
 
-            if not parts:
-                return False, "Invalid format. Use: x, xx, xxx, y, z", None
+    def requeue_writes(self, batch):
+        """Put a failed batch back without clobbering anything written since"""
+        with self.write_lock:
+            for cell_range, value in batch.items():
+                self.pending_writes.setdefault(cell_range, value)
 
-            first_part = parts[0]
-            if not first_part or first_part[0] not in ['x', 'y', 'z']:
-                return False, "Start with x, y, or z", None
+    def get_moscow_now(self):
+        return datetime.datetime.now(MOSCOW_TZ)
 
-            habit_type = first_part[0]
-            count = len(first_part)
+    # ===================== ACTIVITY (FIXED) =====================
 
-            if not all(c == habit_type for c in first_part):
-                return False, f"Use only '{habit_type}' characters", None
+    def record_activity(self, user_id, habit_id):
+        """Record activity habit safely into a single daily row"""
+        try:
+            now = self.get_moscow_now()
+            today_str, week_number = get_date_strings(now.date())
 
-            cost = 0
-            if len(parts) > 1:
-                try:
-                    cost = int(float(parts[1]))
-                except (ValueError, IndexError):
-                    cost = 0
+            if habit_id not in HABIT_MAP:
+                return False, "Invalid habit number. Use 1-5."
 
-            col_map = {
-                'x': {'count_col': 'Coffee (x)', 'cost_col': 'Coffee Cost', 'name': 'Coffee', 'category': 'coffee'},
-                'y': {'count_col': 'Sugary (y)', 'cost_col': 'Sugary Cost', 'name': 'Sugary drinks', 'category': 'sugar_flour'},
-                'z': {'count_col': 'Flour (z)', 'cost_col': 'Flour Cost', 'name': 'Flour products', 'category': 'sugar_flour'}
-            }
+            column_name, habit_name = HABIT_MAP[habit_id]
 
-            config = col_map[habit_type]
+            logger.debug("📝 Recording %s for %s on %s", habit_name, user_id, today_str)
 
-            row_num = self.find_or_create_consumption_row(user_id, today_str, week_number)
-            if not row_num:
-                return False, "Failed to create consumption row", None
+            col_index = self.get_header_index(self.activity_sheet).get(column_name)
+            if col_index is None:
+                return False, f"Column '{column_name}' not found in Activity sheet"
 
-            headers = self.consumption_sheet.row_values(1)
+            timestamp = now.strftime("%H:%M")
 
-            try:
-                count_col_index = headers.index(config['count_col']) + 1
-            except ValueError:
-                self.consumption_sheet.update_cell(1, len(headers) + 1, config['count_col'])
-                count_col_index = len(headers) + 1
-                headers = self.consumption_sheet.row_values(1)
+            # Every habit cell of today's row; fetched together so later
+            # habits are checked against the cell cache instead of Sheets
+            habit_cols = [
+                col for col in map(self.get_header_index(self.activity_sheet).get, HABIT_COLUMNS) if col
+            ]
+
+            # Serialise read-modify-write of today's row across worker threads
+            with self.sheet_locks[self.activity_sheet.title]:
+                row_num, created = self.get_row(
+                    self.activity_sheet, user_id, today_str, week_number,
+                    initial_values={column_name: "✓"}
+                )
+                if not row_num:
+                    return False, "Failed to create activity row"
+
+                # A brand-new row already carries the checkmark
+                if created:
+                    self.remember_cells(
+                        self.activity_sheet, row_num, {col: "✓" if col == col_index else "" for col in habit_cols}
+                    )
+                    return True, f"✓ {habit_name} recorded at {timestamp}!"
+
+                values = self.read_cells(self.activity_sheet, [(row_num, col) for col in habit_cols])
+                current_value = values[habit_cols.index(col_index)]
+                if current_value and str(current_value).strip():
+                    return False, f"{habit_name} already recorded today"
+
+                self.write_cells([self.cell_update(self.activity_sheet, row_num, col_index, "✓")])
+
+                return True, f"✓ {habit_name} recorded at {timestamp}!"
 
-            try:
-                cost_col_index = headers.index(config['cost_col']) + 1
-            except ValueError:
-                self.consumption_sheet.update_cell(1, len(headers) + 1, config['cost_col'])
-                cost_col_index = len(headers) + 1
+        except Exception as e:
+            logger.exception("❌ Error recording activity: %s", e)
+            self.invalidate_caches()
+            return False, "Error recording habit"
 
-            current_count_val = self.consumption_sheet.cell(row_num, count_col_index).value
-            current_cost_val = self.consumption_sheet.cell(row_num, cost_col_index).value
+    # ===================== CONSUMPTION =====================
 
-            try:
-                current_count = int(current_count_val) if current_count_val and str(current_count_val).strip() else 0
-            except (ValueError, TypeError):
-                current_count = 0
+    def record_consumption(self, user_id, text):
+        """Record an x/y/z message; text must already be stripped and lower-cased"""
+        try:
+            now = self.get_moscow_now()
+            today_str, week_number = get_date_strings(now.date())
+
+            match = CONSUMPTION_RE.fullmatch(text)
+            if not match:
+                if not text or text[0] not in CONSUMPTION_PREFIXES:
+                    return False, "Start with x, y, or z", None
+                letters = text.split()[0]
+                if letters.strip(text[0]):
+                    return False, f"Use only '{text[0]}' characters", None
+                return False, "Invalid format. Use: x, xx, xxx, y, z", None
 
-            try:
-                current_cost = int(current_cost_val) if current_cost_val and str(current_cost_val).strip() else 0
-            except (ValueError, TypeError):
-                current_cost = 0
-
-            new_count = current_count + count
-            new_cost = current_cost + cost
-
-            self.consumption_sheet.update_cell(row_num, count_col_index, new_count)
-            if cost > 0:
-                self.consumption_sheet.update_cell(row_num, cost_col_index, new_cost)
-
-            # Get motivational message with image filename
-            motivational_msg, image_filename = self.get_random_message(
-                config['category'], 
-                count=count, 
-                total=new_count, 
-                item_name=config['name']
-            )
+            habit_type = match["habit"]
+            count = len(match["letters"])
+            # "150.5" truncates to 150, as before
+            cost = int(float(match["cost"])) if match["cost"] else 0
+
+            config = CONSUMPTION_MAP[habit_type]
+
+            # Serialise read-modify-write of today's row across worker threads
+            with self.sheet_locks[self.consumption_sheet.title]:
+                updates = []
+                count_col_index = self.get_column_index(self.consumption_sheet, config['count_col'], updates)
+                cost_col_index = self.get_column_index(self.consumption_sheet, config['cost_col'], updates)
+
+                row_num, created = self.get_row(
+                    self.consumption_sheet, user_id, today_str, week_number,
+                    initial_values={config['count_col']: count, config['cost_col']: cost}
+                )
+                if not row_num:
+                    return False, "Failed to create consumption row", None
+
+                if created:
+                    # The new row was appended with today's values already in place;
+                    # only newly queued header cells (if any) remain to be written.
+                    self.remember_cells(self.consumption_sheet, row_num, {count_col_index: count, cost_col_index: cost})
+                    self.write_cells(updates)
+                    motivational_msg, image_filename = self.get_random_message(
+                        config['category'],
+                        count=count,
+                        total=count,
+                        item_name=config['name']
+                    )
+                    return True, motivational_msg, image_filename
+
+                current_count_val, current_cost_val = self.read_cells(
+                    self.consumption_sheet, [(row_num, count_col_index), (row_num, cost_col_index)]
+                )
+
+                current_count = cell_int(current_count_val)
+                current_cost = cell_int(current_cost_val)
+
+                new_count = current_count + count
+                new_cost = current_cost + cost
+
+                updates.append(self.cell_update(self.consumption_sheet, row_num, count_col_index, new_count))
+                if cost > 0:
+                    updates.append(self.cell_update(self.consumption_sheet, row_num, cost_col_index, new_cost))
+                self.write_cells(updates)
+
+                # Get motivational message with image filename
+                motivational_msg, image_filename = self.get_random_message(
+                    config['category'], 
+                    count=count, 
+                    total=new_count, 
+                    item_name=config['name']
+                )
             
-            return True, motivational_msg, image_filename
+                return True, motivational_msg, image_filename
 
         except Exception as e:
-            logger.error(f"❌ Error recording consumption: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception("❌ Error recording consumption: %s", e)
+            self.invalidate_caches()
             return False, "Error recording consumption", None
 
-    def find_or_create_consumption_row(self, user_id, date_str, week_number):
-        try:
-            all_data = self.consumption_sheet.get_all_values()
-
-            for i, row in enumerate(all_data[1:], start=2):
-                if len(row) >= 2:
-                    row_user = str(row[0]).strip() if row[0] else ""
-                    row_date = str(row[1]).strip() if row[1] else ""
-                    if row_user == str(user_id) and row_date == date_str:
-                        return i
-
-            headers = self.consumption_sheet.row_values(1)
-            new_row = [str(user_id), date_str]
-
-            for i in range(2, len(headers)):
-                header_name = headers[i]
-                if "Cost" in header_name or header_name in ['Coffee (x)', 'Sugary (y)', 'Flour (z)']:
-                    new_row.append(0)
-                elif header_name == "Week Number":
-                    new_row.append(week_number)
-                else:
-                    new_row.append("")
-
-            self.consumption_sheet.append_row(new_row)
-            return len(all_data) + 1
-
-        except Exception as e:
-            logger.error(f"Error finding consumption row: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
-            return None
-
     # ===================== LANGUAGE =====================
 
     def record_language(self, user_id, lang_code):
         try:
             now = self.get_moscow_now()
-            today_str = now.strftime("%Y-%m-%d")
-            week_number = self.get_week_number(now)
+            today_str, week_number = get_date_strings(now.date())
 
-            lang_map = {
-                'ch': ('Chinese (ch)', 'Chinese'),
-                'he': ('Hebrew (he)', 'Hebrew'),
-                'ta': ('Tatar (ta)', 'Tatar')
-            }
-
-            if lang_code not in lang_map:
+            if lang_code not in LANG_MAP:
                 return False, "Invalid language code. Use: ch, he, ta"
 
-            column_name, lang_name = lang_map[lang_code]
-
-            row_num = self.find_or_create_language_row(user_id, today_str, week_number)
-            if not row_num:
-                return False, "Failed to create language row"
+            column_name, lang_name = LANG_MAP[lang_code]
 
-            headers = self.language_sheet.row_values(1)
+            # Serialise read-modify-write of today's row across worker threads
+            with self.sheet_locks[self.language_sheet.title]:
+                updates = []
+                col_index = self.get_column_index(self.language_sheet, column_name, updates)
+                timestamp = now.strftime("%H:%M")
 
-            col_index = None
-            for idx, header in enumerate(headers, start=1):
-                if header.strip() == column_name:
-                    col_index = idx
-                    break
+                row_num, created = self.get_row(
+                    self.language_sheet, user_id, today_str, week_number,
+                    initial_values={column_name: 1}
+                )
+                if not row_num:
+                    return False, "Failed to create language row"
 
-            if col_index is None:
-                self.language_sheet.update_cell(1, len(headers) + 1, column_name)
-                col_index = len(headers) + 1
+                if created:
+                    self.remember_cells(self.language_sheet, row_num, {col_index: 1})
+                    self.write_cells(updates)
+                    return True, f"✓ {lang_name} session #1 recorded at {timestamp}!"
 
-            current_value = self.language_sheet.cell(row_num, col_index).value
-            try:
-                current_sessions = int(current_value) if current_value and str(current_value).strip() else 0
-            except (ValueError, TypeError):
-                current_sessions = 0
+                current_value, = self.read_cells(self.language_sheet, [(row_num, col_index)])
+                current_sessions = cell_int(current_value)
 
-            new_sessions = current_sessions + 1
-            timestamp = now.strftime("%H:%M")
+                new_sessions = current_sessions + 1
 
-            self.language_sheet.update_cell(row_num, col_index, new_sessions)
+                updates.append(self.cell_update(self.language_sheet, row_num, col_index, new_sessions))
+                self.write_cells(updates)
 
-            return True, f"✓ {lang_name} session #{new_sessions} recorded at {timestamp}!"
+                return True, f"✓ {lang_name} session #{new_sessions} recorded at {timestamp}!"
 
         except Exception as e:
-            logger.error(f"❌ Error recording language: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception("❌ Error recording language: %s", e)
+            self.invalidate_caches()
             return False, "Error recording language"
 
-    def find_or_create_language_row(self, user_id, date_str, week_number):
-        try:
-            all_data = self.language_sheet.get_all_values()
 
-            for i, row in enumerate(all_data[1:], start=2):
-                if len(row) >= 2:
-                    row_user = str(row[0]).strip() if row[0] else ""
-                    row_date = str(row[1]).strip() if row[1] else ""
-                    if row_user == str(user_id) and row_date == date_str:
-                        return i
+# ================= TELEGRAM HANDLERS =================
 
-            headers = self.language_sheet.row_values(1)
-            new_row = [str(user_id), date_str]
+async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    await update.message.reply_text(HELP_TEXT)
 
-            for i in range(2, len(headers)):
-                header_name = headers[i]
-                if header_name in ['Chinese (ch)', 'Hebrew (he)', 'Tatar (ta)']:
-                    new_row.append(0)
-                elif header_name == "Week Number":
-                    new_row.append(week_number)
-                else:
-                    new_row.append("")
 
-            self.language_sheet.append_row(new_row)
-            return len(all_data) + 1
+async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    await update.message.reply_text(HELP_TEXT)
 
-        except Exception as e:
-            logger.error(f"Error finding language row: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
-            return None
 
+async def handle_language(update: Update, bot, user_id, text):
+    """Record a language session; returns False if text isn't a language code"""
+    if text not in LANG_CODES:
+        return False
 
-# ================= TELEGRAM HANDLERS =================
+    success, message = await asyncio.to_thread(bot.record_language, user_id, text)
+    await update.message.reply_text(message)
+    return True
 
-async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    help_text = """
-🥋 Sambo Habit Tracker Bot
 
-📊 ACTIVITY:
-/1 Prayer
-/2 Qi Gong
-/3 Ball
-/4 Run/Stretch
-/5 Strength/Stretch
-
-🍽 CONSUMPTION:
-x, xx, xxx (+ cost)
-y, yy, yyy
-z, zz, zzz
+async def handle_consumption(update: Update, bot, user_id, text):
+    """Record an x/y/z message and reply with its image and motivational text"""
+    success, message, image_filename = await asyncio.to_thread(
+        bot.record_consumption, user_id, text
+    )
 
-🌍 LANGUAGES:
-ch, he, ta
-"""
-    await update.message.reply_text(help_text)
+    # Send image first if available
+    if success and image_filename:
+        try:
+            # Try to find image in images folder
+            script_dir = os.path.dirname(os.path.abspath(__file__))
+            image_path = os.path.join(script_dir, "images", image_filename)
+            
+            # If not found, try current directory
+            if not os.path.exists(image_path):
+                image_path = os.path.join(script_dir, image_filename)
+            
+            if os.path.exists(image_path):
+                with open(image_path, 'rb') as image_file:
+                    await update.message.reply_photo(photo=image_file)
+                logger.debug("✅ Sent image: %s", image_filename)
+            else:
+                logger.warning("⚠️ Image not found: %s", image_path)
+        except Exception as e:
+            logger.error("❌ Error sending image: %s", e)
+    
+    # Send text message
+    await update.message.reply_text(message)
+    return True
 
 
-async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    await start(update, context)
+# First character of a message -> handler that records it
+MESSAGE_ROUTES = {
+    **{lang_code[0]: handle_language for lang_code in LANG_MAP},
+    **{letter: handle_consumption for letter in CONSUMPTION_MAP}
+}
 
 
 async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
     bot = context.bot_data["sambo_bot"]
     user_id = update.effective_user.id
-
-    if user_id != int(bot.user_id):
-        await update.message.reply_text("Unauthorized.")
-        return
-
     text = update.message.text.strip().lower()
 
-    if text in ['ch', 'he', 'ta']:
-        success, message = bot.record_language(user_id, text)
-        await update.message.reply_text(message)
-        return
-
-    if text and text[0] in ['x', 'y', 'z']:
-        success, message, image_filename = bot.record_consumption(user_id, text)
-        
-        # Send image first if available
-        if success and image_filename:
-            try:
-                # Try to find image in images folder
-                script_dir = os.path.dirname(os.path.abspath(__file__))
-                image_path = os.path.join(script_dir, "images", image_filename)
-                
-                # If not found, try current directory
-                if not os.path.exists(image_path):
-                    image_path = os.path.join(script_dir, image_filename)
-                
-                if os.path.exists(image_path):
-                    with open(image_path, 'rb') as image_file:
-                        await update.message.reply_photo(photo=image_file)
-                    logger.info(f"✅ Sent image: {image_filename}")
-                else:
-                    logger.warning(f"⚠️ Image not found: {image_path}")
-            except Exception as e:
-                logger.error(f"❌ Error sending image: {e}")
-        
-        # Send text message
-        await update.message.reply_text(message)
+    route = MESSAGE_ROUTES.get(text[:1])
+    if route and await route(update, bot, user_id, text):
         return
 
     await update.message.reply_text("Unknown command. /help")
@@ -505,44 +891,80 @@ async def handle_activity(update: Update, context: ContextTypes.DEFAULT_TYPE, ha
     bot = context.bot_data["sambo_bot"]
     user_id = update.effective_user.id
 
-    if user_id != int(bot.user_id):
-        await update.message.reply_text("Unauthorized.")
-        return
-
-    success, message = bot.record_activity(user_id, habit_id)
+    success, message = await asyncio.to_thread(bot.record_activity, user_id, habit_id)
     await update.message.reply_text(message)
 
 
-async def habit_1(update: Update, context: ContextTypes.DEFAULT_TYPE): await handle_activity(update, context, 1)
-async def habit_2(update: Update, context: ContextTypes.DEFAULT_TYPE): await handle_activity(update, context, 2)
-async def habit_3(update: Update, context: ContextTypes.DEFAULT_TYPE): await handle_activity(update, context, 3)
-async def habit_4(update: Update, context: ContextTypes.DEFAULT_TYPE): await handle_activity(update, context, 4)
-async def habit_5(update: Update, context: ContextTypes.DEFAULT_TYPE): await handle_activity(update, context, 5)
+async def unauthorized(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    await update.message.reply_text("Unauthorized.")
+
+
+async def habit_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /1-/5 by reading the habit number from the command itself"""
+    command = update.message.text.split()[0].split("@")[0]
+    await handle_activity(update, context, int(command[1:]))
 
 
 # ===================== MAIN =====================
 
+async def flush_periodically(bot):
+    """Push buffered cell writes to Sheets every FLUSH_INTERVAL seconds"""
+    while True:
+        await asyncio.sleep(FLUSH_INTERVAL)
+        try:
+            await asyncio.to_thread(bot.flush_writes)
+        except Exception as e:
+            logger.error("❌ Error flushing writes: %s", e)
+
+
+async def post_init(application: Application):
+    application.bot_data["flush_task"] = asyncio.create_task(
+        flush_periodically(application.bot_data["sambo_bot"])
+    )
+
+
+async def post_stop(application: Application):
+    application.bot_data["flush_task"].cancel()
+
+
+async def post_shutdown(application: Application):
+    # Don't lose commands that arrived since the last periodic flush
+    bot = application.bot_data["sambo_bot"]
+    await asyncio.to_thread(bot.flush_writes)
+
+
 def main():
     try:
         logger.info("🚀 Starting Sambo Bot...")
         bot = SamboBot()
 
-        application = Application.builder().token(bot.bot_token).build()
+        application = (
+            Application.builder()
+            .token(bot.bot_token)
+            .concurrent_updates(MAX_CONCURRENT_UPDATES)
+            .post_init(post_init)
+            .post_stop(post_stop)
+            .post_shutdown(post_shutdown)
+            .build()
+        )
         application.bot_data["sambo_bot"] = bot
 
         application.add_handler(CommandHandler("start", start))
         application.add_handler(CommandHandler("help", help_command))
-        application.add_handler(CommandHandler("1", habit_1))
-        application.add_handler(CommandHandler("2", habit_2))
-        application.add_handler(CommandHandler("3", habit_3))
-        application.add_handler(CommandHandler("4", habit_4))
-        application.add_handler(CommandHandler("5", habit_5))
-        application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handle_message))
+
+        # Only the configured user matches the recording handlers; anyone else
+        # falls through to the catch-all unauthorized handler registered last
+        authorized = filters.User(user_id=bot.user_id)
+        application.add_handler(
+            CommandHandler([str(habit_id) for habit_id in HABIT_MAP], habit_command, filters=authorized)
+        )
+        application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND & authorized, handle_message))
+        application.add_handler(MessageHandler(filters.TEXT & ~authorized, unauthorized))
 
         application.run_polling(allowed_updates=Update.ALL_TYPES, drop_pending_updates=True)
 
     except Exception as e:
-        logger.error(f"❌ Failed to start: {e}")
+        logger.error("❌ Failed to start: %s", e)
         raise
 
 